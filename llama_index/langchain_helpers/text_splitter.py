@@ -150,34 +150,83 @@ class TokenTextSplitter(TextSplitter):
             CBEventType.CHUNKING, payload={EventPayload.CHUNKS: text}
         )
 
-        # NOTE: Consider metadata info str that will be added to the chunk at query time
-        #       This reduces the effective chunk size that we can have
-        if metadata_str is not None:
-            # NOTE: extra 2 newline chars for formatting when prepending in query
-            num_extra_tokens = len(self.tokenizer(f"{metadata_str}\n\n")) + 1
-            effective_chunk_size = self._chunk_size - num_extra_tokens
-
-            if effective_chunk_size <= 0:
-                raise ValueError(
-                    "Effective chunk size is non positive after considering metadata"
-                )
-        else:
-            effective_chunk_size = self._chunk_size
+        effective_chunk_size = self._get_effective_chunk_size(metadata_str)
+
+        # NOTE: the default (byte level BPE) tokenizer emits at most one token
+        # per utf-8 byte, so a text with fewer bytes than the effective chunk
+        # size is a single chunk and does not need to be tokenized. Other
+        # tokenizers may add special tokens, so they always tokenize.
+        if (
+            self.tokenizer is globals_helper.tokenizer
+            and len(text) < effective_chunk_size
+            and len(text.encode("utf-8", "surrogatepass")) < effective_chunk_size
+        ):
+            docs = self._postprocess_splits([TextSplit(text, 0)])
+            self.callback_manager.on_event_end(
+                CBEventType.CHUNKING,
+                payload={EventPayload.CHUNKS: [x.text_chunk for x in docs]},
+                event_id=event_id,
+            )
+            return docs
 
         # First we naively split the large input into a bunch of smaller ones.
         splits = text.split(self._separator)
         splits = self._preprocess_splits(splits, effective_chunk_size)
         # We now want to combine these smaller pieces into medium size
         # chunks to send to the LLM.
-        docs: List[TextSplit] = []
+        docs = self._merge_splits(splits, effective_chunk_size)
+
+        # run postprocessing to remove blank spaces
+        docs = self._postprocess_splits(docs)
+        self.callback_manager.on_event_end(
+            CBEventType.CHUNKING,
+            payload={EventPayload.CHUNKS: [x.text_chunk for x in docs]},
+            event_id=event_id,
+        )
+        return docs
+
+    def _get_effective_chunk_size(self, metadata_str: Optional[str] = None) -> int:
+        """Get the chunk size left for text after the metadata string."""
+        # NOTE: Consider metadata info str that will be added to the chunk at query time
+        #       This reduces the effective chunk size that we can have
+        if metadata_str is None:
+            return self._chunk_size
+
+        # NOTE: extra 2 newline chars for formatting when prepending in query
+        num_extra_tokens = len(self.tokenizer(f"{metadata_str}\n\n")) + 1
+        effective_chunk_size = self._chunk_size - num_extra_tokens
+        if effective_chunk_size <= 0:
+            raise ValueError(
+                "Effective chunk size is non positive after considering metadata"
+            )
+        return effective_chunk_size
 
+    def _get_split_token_counts(self, splits: List[str]) -> List[int]:
+        """Get the number of tokens of each split, counting empty splits as one."""
+        return [max(len(self.tokenizer(split)), 1) for split in splits]
+
+    def _merge_splits(
+        self,
+        splits: List[str],
+        effective_chunk_size: int,
+        split_token_counts: Optional[List[int]] = None,
+    ) -> List[TextSplit]:
+        """Combine splits into chunks with overlap.
+
+        Each split is tokenized once, unless its token count is given in
+        `split_token_counts`.
+
+        """
+        if split_token_counts is None:
+            split_token_counts = self._get_split_token_counts(splits)
+
+        docs: List[TextSplit] = []
         start_idx = 0
         cur_idx = 0
         cur_total = 0
         prev_idx = 0  # store the previous end index
         while cur_idx < len(splits):
-            cur_token = splits[cur_idx]
-            num_cur_tokens = max(len(self.tokenizer(cur_token)), 1)
+            num_cur_tokens = split_token_counts[cur_idx]
             if num_cur_tokens > effective_chunk_size:
                 raise ValueError(
                     "A single term is larger than the allowed chunk size.\n"
@@ -209,10 +258,7 @@ class TokenTextSplitter(TextSplitter):
                 # we need to enforce that start_idx <= cur_idx, otherwise
                 # start_idx has a chance of going out of bounds.
                 while cur_total > self._chunk_overlap and start_idx < cur_idx:
-                    # # call tokenizer on entire overlap
-                    # cur_total = self.tokenizer()
-                    cur_num_tokens = max(len(self.tokenizer(splits[start_idx])), 1)
-                    cur_total -= cur_num_tokens
+                    cur_total -= split_token_counts[start_idx]
                     start_idx += 1
                 # NOTE: This is a hack, make more general
                 if start_idx == cur_idx:
@@ -220,12 +266,8 @@ class TokenTextSplitter(TextSplitter):
             # Build up the current_doc with term d, and update the total counter with
             # the number of the number of tokens in d, wrt self.tokenizer
 
-            # we reassign cur_token and num_cur_tokens, because cur_idx
-            # may have changed
-            cur_token = splits[cur_idx]
-            num_cur_tokens = max(len(self.tokenizer(cur_token)), 1)
-
-            cur_total += num_cur_tokens
+            # we re-read num_cur_tokens, because cur_idx may have changed
+            cur_total += split_token_counts[cur_idx]
             cur_idx += 1
         overlap = 0
         # after first round, check if last chunk ended after this chunk begins
@@ -234,14 +276,6 @@ class TokenTextSplitter(TextSplitter):
                 range(start_idx, prev_idx)
             )
         docs.append(TextSplit(self._separator.join(splits[start_idx:cur_idx]), overlap))
-
-        # run postprocessing to remove blank spaces
-        docs = self._postprocess_splits(docs)
-        self.callback_manager.on_event_end(
-            CBEventType.CHUNKING,
-            payload={EventPayload.CHUNKS: [x.text_chunk for x in docs]},
-            event_id=event_id,
-        )
         return docs
 
     def truncate_text(self, text: str) -> str:
@@ -1,9 +1,32 @@
 """General node utils."""
 
 
+import copy
 import logging
-from typing import List
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from hashlib import sha1
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    cast,
+)
 
+from llama_index.callbacks.base import CallbackManager
+from llama_index.callbacks.schema import CBEventType, EventPayload
 from llama_index.langchain_helpers.text_splitter import (
     TextSplit,
     TextSplitter,
@@ -22,50 +45,321 @@ from llama_index.utils import truncate_text
 
 logger = logging.getLogger(__name__)
 
+# documents longer than this (in characters) are split into sections that are
+# tokenized as independent tasks by `get_nodes_from_documents`
+DEFAULT_PARALLEL_SECTION_SIZE = 64 * 1024
+
+# LRU cache of token splits, keyed on the document content hash, the metadata
+# string and the splitter configuration
+TEXT_SPLITS_CACHE_SIZE = 4096
+# (text chunk, num char overlap, metadata) of a text split
+_TextSplitFields = Tuple[str, Optional[int], Optional[Dict[str, Any]]]
+_text_splits_cache: "OrderedDict[Hashable, Tuple[_TextSplitFields, ...]]" = (
+    OrderedDict()
+)
+_text_splits_cache_lock = threading.Lock()
+
+# (splits, token count of each split) of a section of text
+_SplitSection = Tuple[List[str], List[int]]
+
+_token_split_text_with_overlaps = TokenTextSplitter.split_text_with_overlaps
+
+
+def _can_split_in_sections(text_splitter: TextSplitter) -> bool:
+    """Whether the text splitter splits text the default token splitter way."""
+    if not isinstance(text_splitter, TokenTextSplitter):
+        return False
+    split_fn = text_splitter.split_text_with_overlaps
+    return getattr(split_fn, "__func__", None) is _token_split_text_with_overlaps
+
+
+def _get_split_sections(
+    text_splitter: TokenTextSplitter, text: str, section_size: int
+) -> List[List[str]]:
+    """Cut the splits of text into sections of about `section_size` chars."""
+    sections = []
+    section: List[str] = []
+    section_len = 0
+    for split in text.split(text_splitter._separator):
+        if section and section_len + len(split) > section_size:
+            sections.append(section)
+            section = []
+            section_len = 0
+        section.append(split)
+        section_len += len(split) + len(text_splitter._separator)
+    sections.append(section)
+    return sections
+
+
+def _tokenize_split_section(
+    text_splitter: TokenTextSplitter, splits: List[str], effective_chunk_size: int
+) -> _SplitSection:
+    """Preprocess a section of splits and count the tokens of each split."""
+    splits = text_splitter._preprocess_splits(splits, effective_chunk_size)
+    return splits, text_splitter._get_split_token_counts(splits)
+
+
+def _merge_split_sections(
+    text_splitter: TokenTextSplitter,
+    text: str,
+    split_sections: Sequence[_SplitSection],
+    effective_chunk_size: int,
+) -> List[TextSplit]:
+    """Merge the tokenized sections of text into text splits with overlaps.
+
+    Splits never span sections, so this gives the same text splits (and
+    callback events) as `split_text_with_overlaps`.
+
+    """
+    event_id = text_splitter.callback_manager.on_event_start(
+        CBEventType.CHUNKING, payload={EventPayload.CHUNKS: text}
+    )
+    splits = [split for section_splits, _ in split_sections for split in section_splits]
+    split_token_counts = [
+        num_tokens
+        for _, section_counts in split_sections
+        for num_tokens in section_counts
+    ]
+    text_splits = text_splitter._merge_splits(
+        splits, effective_chunk_size, split_token_counts=split_token_counts
+    )
+    text_splits = text_splitter._postprocess_splits(text_splits)
+    text_splitter.callback_manager.on_event_end(
+        CBEventType.CHUNKING,
+        payload={EventPayload.CHUNKS: [x.text_chunk for x in text_splits]},
+        event_id=event_id,
+    )
+    return text_splits
+
+
+def _split_text_with_overlaps_parallel(
+    text_splitter: TokenTextSplitter,
+    text: str,
+    metadata_str: Optional[str],
+    section_size: int,
+    num_workers: int,
+) -> List[TextSplit]:
+    """Split text with overlaps, tokenizing its sections concurrently.
+
+    Only merging the tokenized splits into chunks is done serially.
+
+    """
+    effective_chunk_size = text_splitter._get_effective_chunk_size(metadata_str)
+    tokenize_section = partial(
+        _tokenize_split_section,
+        text_splitter,
+        effective_chunk_size=effective_chunk_size,
+    )
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        split_sections = list(
+            executor.map(
+                tokenize_section,
+                _get_split_sections(text_splitter, text, section_size),
+            )
+        )
+    return _merge_split_sections(
+        text_splitter, text, split_sections, effective_chunk_size
+    )
+
+
+def _get_splitter_signature(text_splitter: TokenTextSplitter) -> Hashable:
+    """Get a hashable signature of the splitter configuration."""
+    split_fn = text_splitter.split_text_with_overlaps
+    return (
+        type(text_splitter),
+        getattr(split_fn, "__func__", split_fn),
+        text_splitter._chunk_size,
+        text_splitter._chunk_overlap,
+        text_splitter._separator,
+        tuple(text_splitter._backup_separators or ()),
+        text_splitter.tokenizer,
+    )
+
+
+def _get_cached_text_splits(
+    key: Hashable,
+) -> Optional[Tuple[_TextSplitFields, ...]]:
+    """Get the cached text split fields for key, if any.
+
+    The cached metadata dicts are shared, callers must copy them before
+    handing them out.
+
+    """
+    with _text_splits_cache_lock:
+        cached_splits = _text_splits_cache.get(key)
+        if cached_splits is not None:
+            _text_splits_cache.move_to_end(key)
+    return cached_splits
+
+
+def _cache_text_splits(key: Hashable, text_splits: List[TextSplit]) -> None:
+    """Cache an immutable copy of the text splits under key."""
+    cached_splits = tuple(
+        (
+            text_split.text_chunk,
+            text_split.num_char_overlap,
+            dict(text_split.metadata) if text_split.metadata is not None else None,
+        )
+        for text_split in text_splits
+    )
+    with _text_splits_cache_lock:
+        _text_splits_cache[key] = cached_splits
+        _text_splits_cache.move_to_end(key)
+        while len(_text_splits_cache) > TEXT_SPLITS_CACHE_SIZE:
+            _text_splits_cache.popitem(last=False)
+
+
+def clear_text_splits_cache() -> None:
+    """Clear the cache of token splits."""
+    with _text_splits_cache_lock:
+        _text_splits_cache.clear()
+
 
 def get_text_splits_from_document(
     document: BaseNode,
     text_splitter: TextSplitter,
     include_metadata: bool = True,
+    parallel_threshold: Optional[int] = None,
+    use_cache: bool = False,
 ) -> List[TextSplit]:
-    """Break the document into chunks with additional info."""
+    """Break the document into chunks with additional info.
+
+    With a `TokenTextSplitter`, documents longer than `parallel_threshold`
+    characters are tokenized in sections on a thread pool, which gives the
+    same splits as splitting serially. By default, documents are split serially.
+
+    If `use_cache` is True, token splits are kept in an in-memory LRU cache of
+    `TEXT_SPLITS_CACHE_SIZE` documents, so that re-ingesting the same content
+    skips the splitter. Cache hits still emit the splitter chunking events.
+
+    """
+    return list(
+        _iter_text_splits_from_document(
+            document,
+            text_splitter,
+            include_metadata=include_metadata,
+            parallel_threshold=parallel_threshold,
+            use_cache=use_cache,
+        )
+    )
+
+
+def _iter_text_splits_from_document(
+    document: BaseNode,
+    text_splitter: TextSplitter,
+    include_metadata: bool = True,
+    parallel_threshold: Optional[int] = None,
+    use_cache: bool = False,
+) -> Iterator[TextSplit]:
+    """Break the document into chunks with additional info, one at a time.
+
+    This does not lower peak memory with a `TokenTextSplitter`, which splits
+    the whole text up front, so its full list of splits stays alive until the
+    generator is exhausted.
+
+    """
+    for text_chunk, num_char_overlap, metadata in _iter_text_split_fields(
+        document,
+        text_splitter,
+        include_metadata=include_metadata,
+        parallel_threshold=parallel_threshold,
+        use_cache=use_cache,
+    ):
+        yield TextSplit(
+            text_chunk=text_chunk,
+            num_char_overlap=num_char_overlap,
+            metadata=dict(metadata) if metadata is not None else None,
+        )
+
+
+def _iter_text_split_fields(
+    document: BaseNode,
+    text_splitter: TextSplitter,
+    include_metadata: bool = True,
+    parallel_threshold: Optional[int] = None,
+    use_cache: bool = False,
+) -> Iterator[_TextSplitFields]:
+    """Break the document into (chunk, char overlap, metadata) tuples.
+
+    Plain string chunks and cached splits are yielded without building a
+    `TextSplit`. The yielded metadata may be shared and must not be mutated.
+    Splitters return all their chunks at once, so the generator keeps them
+    alive until it is exhausted.
+
+    """
     # TODO: clean up since this only exists due to the diff w LangChain's TextSplitter
     if isinstance(text_splitter, TokenTextSplitter):
         # use this to extract extra information about the chunks
-        text_splits = text_splitter.split_text_with_overlaps(
-            document.get_content(metadata_mode=MetadataMode.NONE),
-            metadata_str=document.get_metadata_str() if include_metadata else None,
-        )
+        text = document.get_content(metadata_mode=MetadataMode.NONE)
+        metadata_str = document.get_metadata_str() if include_metadata else None
+        num_workers = os.cpu_count() or 1
+        section_size = None
+        if (
+            parallel_threshold is not None
+            and len(text) > parallel_threshold
+            and num_workers > 1
+            and _can_split_in_sections(text_splitter)
+        ):
+            section_size = parallel_threshold
+
+        cache_key = None
+        cached_splits = None
+        if use_cache:
+            cache_key = (
+                sha1(text.encode("utf-8", "surrogatepass")).hexdigest(),
+                metadata_str,
+                _get_splitter_signature(text_splitter),
+            )
+            cached_splits = _get_cached_text_splits(cache_key)
+
+        if cached_splits is not None:
+            # NOTE: emit the events the skipped splitter would have emitted
+            callback_manager = text_splitter.callback_manager
+            event_id = callback_manager.on_event_start(
+                CBEventType.CHUNKING, payload={EventPayload.CHUNKS: text}
+            )
+            callback_manager.on_event_end(
+                CBEventType.CHUNKING,
+                payload={EventPayload.CHUNKS: [fields[0] for fields in cached_splits]},
+                event_id=event_id,
+            )
+            yield from cached_splits
+        else:
+            if section_size is not None:
+                text_splits = _split_text_with_overlaps_parallel(
+                    text_splitter,
+                    text,
+                    metadata_str=metadata_str,
+                    section_size=section_size,
+                    num_workers=num_workers,
+                )
+            else:
+                text_splits = text_splitter.split_text_with_overlaps(
+                    text, metadata_str=metadata_str
+                )
+            if cache_key is not None:
+                _cache_text_splits(cache_key, text_splits)
+            for text_split in text_splits:
+                yield (
+                    text_split.text_chunk,
+                    text_split.num_char_overlap,
+                    text_split.metadata,
+                )
     else:
         text_chunks = text_splitter.split_text(document.get_content())
-        text_splits = []
         for text_chunk in text_chunks:
-            text_split = None
+            # NOTE: the document metadata is merged into the split metadata
+            # when building nodes, see `get_nodes_from_document`
             if isinstance(text_chunk, TextSplit):
-                text_split = text_chunk
-            elif isinstance(text_chunk, Document):
-                doc_chunk : Document = text_chunk
-
-                text_split = TextSplit(
-                    text_chunk=doc_chunk.get_text(),
-                    metadata=doc_chunk.metadata,
+                yield (
+                    text_chunk.text_chunk,
+                    text_chunk.num_char_overlap,
+                    text_chunk.metadata,
                 )
+            elif isinstance(text_chunk, Document):
+                yield (text_chunk.get_text(), None, text_chunk.metadata)
             else:
-                text_split = TextSplit(
-                    text_chunk=text_chunk
-                )
-
-            # combine doc_chunk's metadata with the document's metadata
-            if include_metadata and document.metadata:
-                # if doc_chunk has metadata, then combine it with the document's metadata
-                if text_split.metadata is None:
-                    text_split.metadata = {}
-                
-                text_split.metadata.update(document.metadata)
-
-            text_splits.append(text_split)
-
-    return text_splits
+                yield (text_chunk, None, None)
 
 
 def get_nodes_from_document(
@@ -75,72 +369,275 @@ def get_nodes_from_document(
     include_prev_next_rel: bool = False,
 ) -> List[TextNode]:
     """Get nodes from document."""
-    text_splits = get_text_splits_from_document(
+    # NOTE: documents are split serially here, `get_nodes_from_documents` runs
+    # this in process pool workers
+    text_split_fields = _iter_text_split_fields(
         document=document,
         text_splitter=text_splitter,
         include_metadata=include_metadata,
+        parallel_threshold=None,
+    )
+    return _get_nodes_from_split_fields(
+        document,
+        text_split_fields,
+        include_metadata=include_metadata,
+        include_prev_next_rel=include_prev_next_rel,
     )
 
+
+def _get_nodes_from_split_fields(
+    document: BaseNode,
+    text_split_fields: Iterable[_TextSplitFields],
+    include_metadata: bool = True,
+    include_prev_next_rel: bool = False,
+) -> List[TextNode]:
+    """Get nodes from the text split fields of a document."""
+    node_cls: Type[TextNode]
+    node_kwargs: Dict[str, Any]
+    if isinstance(document, ImageDocument):
+        node_cls = ImageNode
+        node_kwargs = {"image": document.image}
+    elif isinstance(document, Document):
+        node_cls = TextNode
+        node_kwargs = {
+            "excluded_embed_metadata_keys": document.excluded_embed_metadata_keys,
+            "excluded_llm_metadata_keys": document.excluded_llm_metadata_keys,
+            "metadata_seperator": document.metadata_seperator,
+            "text_template": document.text_template,
+        }
+    else:
+        raise ValueError(f"Unknown document type: {type(document)}")
+
+    # NOTE: nodes are built straight from the split fields, without an
+    # intermediate `TextSplit` per chunk
+    document_metadata = document.metadata or {}
+    # NOTE: node validation copies the relationships dict, so one dict can be
+    # passed to every node even if prev/next relationships are added later
+    relationships = {NodeRelationship.SOURCE: document.as_related_node_info()}
     nodes: List[TextNode] = []
+    # local names for values looked up on every split
+    embedding = document.embedding
+    append_node = nodes.append
+    log_chunks = logger.isEnabledFor(logging.DEBUG)
     index_counter = 0
-    for i, text_split in enumerate(text_splits):
-        text_chunk = text_split.text_chunk
-        logger.debug(f"> Adding chunk: {truncate_text(text_chunk, 50)}")
+    for text_chunk, num_char_overlap, split_metadata in text_split_fields:
+        if log_chunks:
+            logger.debug(f"> Adding chunk: {truncate_text(text_chunk, 50)}")
         start_char_idx = None
         end_char_idx = None
-        if text_split.num_char_overlap is not None:
-            start_char_idx = index_counter - text_split.num_char_overlap
-            end_char_idx = index_counter - text_split.num_char_overlap + len(text_chunk)
+        if num_char_overlap is not None:
+            start_char_idx = index_counter - num_char_overlap
+            end_char_idx = start_char_idx + len(text_chunk)
+        # each chunk is followed by a one character separator
         index_counter += len(text_chunk) + 1
 
         node_metadata = {}
         if include_metadata:
-            node_metadata = document.metadata
-            if text_split.metadata is not None:
-                node_metadata.update(text_split.metadata)
-
-        if isinstance(document, ImageDocument):
-            image_node = ImageNode(
-                text=text_chunk,
-                embedding=document.embedding,
-                metadata=node_metadata,
-                start_char_idx=start_char_idx,
-                end_char_idx=end_char_idx,
-                image=document.image,
-                relationships={
-                    NodeRelationship.SOURCE: document.as_related_node_info()
-                },
-            )
-            nodes.append(image_node)  # type: ignore
-        elif isinstance(document, Document):
-            node = TextNode(
-                text=text_chunk,
-                embedding=document.embedding,
-                start_char_idx=start_char_idx,
-                end_char_idx=end_char_idx,
-                metadata=node_metadata,
-                excluded_embed_metadata_keys=document.excluded_embed_metadata_keys,
-                excluded_llm_metadata_keys=document.excluded_llm_metadata_keys,
-                metadata_seperator=document.metadata_seperator,
-                text_template=document.text_template,
-                relationships={
-                    NodeRelationship.SOURCE: document.as_related_node_info()
-                },
-            )
-            nodes.append(node)
-        else:
-            raise ValueError(f"Unknown document type: {type(document)}")
+            # NOTE: never update the document metadata in place, splits from
+            # the same document share it
+            node_metadata = document_metadata
+            if split_metadata:
+                node_metadata = {**document_metadata, **split_metadata}
+
+        node = node_cls(
+            text=text_chunk,
+            embedding=embedding,
+            start_char_idx=start_char_idx,
+            end_char_idx=end_char_idx,
+            metadata=node_metadata,
+            relationships=relationships,
+            **node_kwargs,
+        )
+        append_node(node)
 
     # if include_prev_next_rel, then add prev/next relationships
     if include_prev_next_rel:
-        for i, node in enumerate(nodes):
-            if i > 0:
-                node.relationships[NodeRelationship.PREVIOUS] = nodes[
-                    i - 1
-                ].as_related_node_info()
-            if i < len(nodes) - 1:
-                node.relationships[NodeRelationship.NEXT] = nodes[
-                    i + 1
-                ].as_related_node_info()
+        _add_prev_next_relationships(nodes)
 
     return nodes
+
+
+def _add_prev_next_relationships(nodes: List[TextNode]) -> None:
+    """Link each node to its neighbours in the list."""
+    node_infos = [node.as_related_node_info() for node in nodes]
+    last_idx = len(nodes) - 1
+    for i, node in enumerate(nodes):
+        if i > 0:
+            node.relationships[NodeRelationship.PREVIOUS] = node_infos[i - 1]
+        if i < last_idx:
+            node.relationships[NodeRelationship.NEXT] = node_infos[i + 1]
+
+
+def _call(fn_and_args: Tuple[Callable[..., Any], Tuple[Any, ...]]) -> Any:
+    """Call a function with arguments, for dispatching tasks to a pool."""
+    fn, args = fn_and_args
+    return fn(*args)
+
+
+def _get_worker_text_splitter(text_splitter: TextSplitter) -> Optional[TextSplitter]:
+    """Get the splitter to send to process pool workers, if any.
+
+    Callback handlers in the workers would only see events on their copy of
+    the splitter, so a `TokenTextSplitter` is sent without them. Returns None
+    if the splitter has callback handlers or cannot be pickled.
+
+    """
+    worker_text_splitter = text_splitter
+    if isinstance(text_splitter, TokenTextSplitter):
+        worker_text_splitter = copy.copy(text_splitter)
+        worker_text_splitter.callback_manager = CallbackManager([])
+    else:
+        callback_manager = getattr(text_splitter, "callback_manager", None)
+        if callback_manager is not None and callback_manager.handlers:
+            return None
+
+    try:
+        pickle.dumps(worker_text_splitter)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        logger.debug("Text splitter cannot be pickled, parsing serially.")
+        return None
+    return worker_text_splitter
+
+
+def get_nodes_from_documents(
+    documents: Sequence[BaseNode],
+    text_splitter: TextSplitter,
+    include_metadata: bool = True,
+    include_prev_next_rel: bool = False,
+    parallel: bool = True,
+    num_workers: Optional[int] = None,
+    section_size: int = DEFAULT_PARALLEL_SECTION_SIZE,
+) -> List[TextNode]:
+    """Get nodes from a batch of documents.
+
+    If `parallel` is True, documents are split across a process pool and the
+    resulting nodes are flattened back in document order. With a
+    `TokenTextSplitter`, documents longer than `section_size` characters are
+    further tokenized in sections, and the largest tasks are dispatched first
+    so that a single large document does not hold up the whole batch. The
+    nodes are the same as when parsing serially.
+
+    Workers split with a copy of the `TokenTextSplitter` without callback
+    handlers, and its chunking events are emitted here, in document order.
+    Documents are parsed serially if the splitter cannot be pickled, or if it
+    is another splitter with callback handlers.
+
+    """
+    num_workers = num_workers or os.cpu_count() or 1
+    worker_text_splitter = _get_worker_text_splitter(text_splitter)
+    if not parallel or num_workers <= 1 or worker_text_splitter is None:
+        nodes_per_document = [
+            get_nodes_from_document(
+                document,
+                text_splitter,
+                include_metadata=include_metadata,
+                include_prev_next_rel=include_prev_next_rel,
+            )
+            for document in documents
+        ]
+        return [node for nodes in nodes_per_document for node in nodes]
+
+    get_nodes = partial(
+        get_nodes_from_document,
+        text_splitter=worker_text_splitter,
+        include_metadata=include_metadata,
+        include_prev_next_rel=include_prev_next_rel,
+    )
+    split_in_sections = _can_split_in_sections(text_splitter)
+    # build (size, document index, section index, (function, args)) tasks,
+    # large documents are tokenized section by section and merged into chunks
+    # afterwards
+    tasks: List[Tuple[int, int, int, Tuple[Callable[..., Any], Tuple[Any, ...]]]] = []
+    # (text, effective chunk size) of documents tokenized in sections
+    sectioned_documents: Dict[int, Tuple[str, int]] = {}
+    for doc_idx, document in enumerate(documents):
+        text = document.get_content(metadata_mode=MetadataMode.NONE)
+        if (
+            len(text) <= section_size
+            or not split_in_sections
+            or not isinstance(document, Document)
+        ):
+            tasks.append((len(text), doc_idx, 0, (get_nodes, (document,))))
+            continue
+
+        token_text_splitter = cast(TokenTextSplitter, worker_text_splitter)
+        metadata_str = document.get_metadata_str() if include_metadata else None
+        effective_chunk_size = token_text_splitter._get_effective_chunk_size(
+            metadata_str
+        )
+        sectioned_documents[doc_idx] = (text, effective_chunk_size)
+        for section_idx, splits in enumerate(
+            _get_split_sections(token_text_splitter, text, section_size)
+        ):
+            task_args = (token_text_splitter, splits, effective_chunk_size)
+            tasks.append(
+                (
+                    sum(map(len, splits)),
+                    doc_idx,
+                    section_idx,
+                    (_tokenize_split_section, task_args),
+                )
+            )
+
+    # largest tasks first, so that stragglers are small
+    tasks.sort(key=lambda task: task[0], reverse=True)
+
+    if len(tasks) <= 1:
+        task_results = [_call(task[3]) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            task_results = list(
+                executor.map(_call, [task[3] for task in tasks], chunksize=1)
+            )
+
+    results_per_document: Dict[int, List[Tuple[int, Any]]] = {}
+    for (_, doc_idx, section_idx, _), result in zip(tasks, task_results):
+        results_per_document.setdefault(doc_idx, []).append((section_idx, result))
+
+    all_nodes: List[TextNode] = []
+    for doc_idx, document in enumerate(documents):
+        results = [
+            result
+            for _, result in sorted(
+                results_per_document[doc_idx], key=lambda section: section[0]
+            )
+        ]
+        if doc_idx not in sectioned_documents:
+            nodes = results[0]
+            if isinstance(text_splitter, TokenTextSplitter):
+                text = document.get_content(metadata_mode=MetadataMode.NONE)
+                if text != "":
+                    # NOTE: emit the events of the worker splitter copy
+                    callback_manager = text_splitter.callback_manager
+                    event_id = callback_manager.on_event_start(
+                        CBEventType.CHUNKING, payload={EventPayload.CHUNKS: text}
+                    )
+                    callback_manager.on_event_end(
+                        CBEventType.CHUNKING,
+                        payload={EventPayload.CHUNKS: [node.text for node in nodes]},
+                        event_id=event_id,
+                    )
+            all_nodes.extend(nodes)
+            continue
+
+        text, effective_chunk_size = sectioned_documents[doc_idx]
+        text_splits = _merge_split_sections(
+            cast(TokenTextSplitter, text_splitter),
+            text,
+            results,
+            effective_chunk_size,
+        )
+        text_split_fields = (
+            (text_split.text_chunk, text_split.num_char_overlap, text_split.metadata)
+            for text_split in text_splits
+        )
+        all_nodes.extend(
+            _get_nodes_from_split_fields(
+                document,
+                text_split_fields,
+                include_metadata=include_metadata,
+                include_prev_next_rel=include_prev_next_rel,
+            )
+        )
+
+    return all_nodes
@@ -115,13 +115,15 @@ class RetrieverQueryEngine(BaseQueryEngine):
 
     def retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
         nodes = self._retriever.retrieve(query_bundle)
-        nodes = self._apply_node_postprocessors(nodes, query_bundle=query_bundle)
+        if self._node_postprocessors:
+            nodes = self._apply_node_postprocessors(nodes, query_bundle=query_bundle)
 
         return nodes
 
     async def aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
         nodes = await self._retriever.aretrieve(query_bundle)
-        nodes = self._apply_node_postprocessors(nodes, query_bundle=query_bundle)
+        if self._node_postprocessors:
+            nodes = self._apply_node_postprocessors(nodes, query_bundle=query_bundle)
 
         return nodes
 
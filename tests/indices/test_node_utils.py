@@ -3,9 +3,19 @@
 from typing import List
 
 import pytest
+from pytest import MonkeyPatch
 
-from llama_index.langchain_helpers.text_splitter import TokenTextSplitter
-from llama_index.node_parser.node_utils import TextSplit, get_nodes_from_document
+from llama_index.callbacks.base import CallbackManager
+from llama_index.callbacks.llama_debug import LlamaDebugHandler
+from llama_index.callbacks.schema import CBEventType, EventPayload
+from llama_index.langchain_helpers.text_splitter import TextSplitter, TokenTextSplitter
+from llama_index.node_parser import node_utils
+from llama_index.node_parser.node_utils import (
+    TextSplit,
+    get_nodes_from_document,
+    get_nodes_from_documents,
+    get_text_splits_from_document,
+)
 from llama_index.schema import Document, MetadataMode
 
 
@@ -21,6 +31,13 @@ class TokenTextSplitterWithMetadata(TokenTextSplitter):
         return docs
 
 
+class NewlineTextSplitter(TextSplitter):
+    """Text splitter which splits on newlines."""
+
+    def split_text(self, text: str) -> List[str]:
+        return text.split("\n")
+
+
 @pytest.fixture
 def text_splitter() -> TokenTextSplitter:
     """Get text splitter."""
@@ -66,6 +83,24 @@ def test_get_nodes_from_document(
     )
 
 
+def test_get_nodes_from_document_prev_next_rel(
+    documents: List[Document], text_splitter: TokenTextSplitter
+) -> None:
+    """Test prev/next relationships are set per node."""
+    nodes = get_nodes_from_document(
+        documents[0],
+        text_splitter,
+        include_metadata=False,
+        include_prev_next_rel=True,
+    )
+    assert len(nodes) == 2
+    assert nodes[0].ref_doc_id == nodes[1].ref_doc_id == "test_doc_id"
+    assert nodes[0].prev_node is None
+    assert nodes[0].next_node.node_id == nodes[1].node_id
+    assert nodes[1].prev_node.node_id == nodes[0].node_id
+    assert nodes[1].next_node is None
+
+
 def test_get_nodes_from_document_with_metadata(
     documents: List[Document], text_splitter: TokenTextSplitter
 ) -> None:
@@ -114,3 +149,194 @@ def test_get_nodes_from_document_with_node_metadata(
             for n in nodes
         ]
     )
+    # the document metadata is not updated with the splitter metadata
+    assert documents[0].metadata == {"test_key": "test_val"}
+
+
+def test_get_nodes_from_documents_parallel(
+    documents: List[Document], text_splitter: TokenTextSplitter
+) -> None:
+    """Test parallel batch parsing matches parsing documents one by one."""
+    documents = documents + [
+        Document(text=f"Document {i}. " * 20, id_=f"doc_{i}") for i in range(4)
+    ]
+    serial_nodes = get_nodes_from_documents(documents, text_splitter, parallel=False)
+    parallel_nodes = get_nodes_from_documents(
+        documents, text_splitter, parallel=True, num_workers=2
+    )
+    assert len(serial_nodes) == len(parallel_nodes)
+    for serial_node, parallel_node in zip(serial_nodes, parallel_nodes):
+        assert serial_node.get_content() == parallel_node.get_content()
+        assert serial_node.start_char_idx == parallel_node.start_char_idx
+        assert serial_node.end_char_idx == parallel_node.end_char_idx
+        assert serial_node.ref_doc_id == parallel_node.ref_doc_id
+
+
+def test_get_nodes_from_documents_parallel_sections() -> None:
+    """Test large documents tokenized in sections are parsed as a whole."""
+    text_splitter = TokenTextSplitter(chunk_size=20, chunk_overlap=5)
+    doc_text = "\n".join(
+        " ".join(f"word{i}{'.' * (j % 3)}" for j in range(i % 40)) for i in range(300)
+    )
+    documents = [
+        Document(text=doc_text, id_="large_doc", metadata={"test_key": "test_val"}),
+        Document(text="A small document.", id_="small_doc"),
+    ]
+    serial_nodes = get_nodes_from_documents(
+        documents, text_splitter, include_prev_next_rel=True, parallel=False
+    )
+    parallel_nodes = get_nodes_from_documents(
+        documents,
+        text_splitter,
+        include_prev_next_rel=True,
+        num_workers=2,
+        section_size=1000,
+    )
+    assert len(doc_text) > 10 * 1000
+    assert len(serial_nodes) == len(parallel_nodes)
+    for serial_node, parallel_node in zip(serial_nodes, parallel_nodes):
+        assert serial_node.get_content() == parallel_node.get_content()
+        assert serial_node.start_char_idx == parallel_node.start_char_idx
+        assert serial_node.end_char_idx == parallel_node.end_char_idx
+        assert serial_node.metadata == parallel_node.metadata
+        assert serial_node.ref_doc_id == parallel_node.ref_doc_id
+
+    large_nodes = [n for n in parallel_nodes if n.ref_doc_id == "large_doc"]
+    assert parallel_nodes[-1].ref_doc_id == "small_doc"
+    for prev_node, next_node in zip(large_nodes, large_nodes[1:]):
+        assert prev_node.next_node.node_id == next_node.node_id
+        assert next_node.prev_node.node_id == prev_node.node_id
+
+
+def test_get_nodes_from_documents_parallel_events() -> None:
+    """Test parallel parsing emits the same chunking events as serial parsing."""
+    documents = [
+        Document(text=" ".join(f"word{i}" for i in range(500)), id_="large_doc"),
+        Document(text="A small document.", id_="small_doc"),
+        Document(text="Another small document.", id_="other_doc"),
+    ]
+    event_chunks = []
+    for parallel in (False, True):
+        llama_debug = LlamaDebugHandler()
+        text_splitter = TokenTextSplitter(
+            chunk_size=20,
+            chunk_overlap=5,
+            callback_manager=CallbackManager([llama_debug]),
+        )
+        get_nodes_from_documents(
+            documents,
+            text_splitter,
+            parallel=parallel,
+            num_workers=2,
+            section_size=1000,
+        )
+        event_pairs = llama_debug.get_event_pairs(CBEventType.CHUNKING)
+        assert len(event_pairs) == len(documents)
+        event_chunks.append(
+            [(start.payload, end.payload) for start, end in event_pairs]  # type: ignore
+        )
+    assert event_chunks[0] == event_chunks[1]
+
+
+def test_get_nodes_from_documents_parallel_unpicklable() -> None:
+    """Test documents are parsed serially if the splitter cannot be pickled."""
+    text_splitter = TokenTextSplitter(
+        chunk_size=5, chunk_overlap=0, tokenizer=lambda text: text.split()
+    )
+    documents = [
+        Document(text=f"This is document number {i} of the batch.", id_=str(i))
+        for i in range(4)
+    ]
+    serial_nodes = get_nodes_from_documents(documents, text_splitter, parallel=False)
+    parallel_nodes = get_nodes_from_documents(
+        documents, text_splitter, parallel=True, num_workers=2
+    )
+    assert len(serial_nodes) > len(documents)
+    assert [node.get_content() for node in serial_nodes] == [
+        node.get_content() for node in parallel_nodes
+    ]
+
+
+@pytest.mark.parametrize("chunk_overlap", [0, 5])
+def test_get_text_splits_from_document_parallel(
+    monkeypatch: MonkeyPatch, chunk_overlap: int
+) -> None:
+    """Test long documents tokenized in sections are split as a whole."""
+    monkeypatch.setattr(node_utils.os, "cpu_count", lambda: 2)
+    text_splitter = TokenTextSplitter(chunk_size=20, chunk_overlap=chunk_overlap)
+    doc_text = "\n".join(
+        " ".join(f"word{i}{'.' * (j % 3)}" for j in range(i % 40)) for i in range(300)
+    )
+    document = Document(text=doc_text, metadata={"test_key": "test_val"})
+
+    text_splits = get_text_splits_from_document(
+        document, text_splitter, parallel_threshold=1000, use_cache=False
+    )
+    serial_text_splits = get_text_splits_from_document(
+        document, text_splitter, parallel_threshold=None, use_cache=False
+    )
+    assert len(doc_text) > 10 * 1000
+    assert text_splits == serial_text_splits
+
+
+def test_get_text_splits_from_document_cache(
+    text_splitter_with_metadata: TokenTextSplitterWithMetadata,
+) -> None:
+    """Test token splits are cached per content and splitter configuration."""
+    node_utils.clear_text_splits_cache()
+    llama_debug = LlamaDebugHandler()
+    text_splitter_with_metadata.callback_manager = CallbackManager([llama_debug])
+    document = Document(text="Hello world. " * 20)
+
+    # the cache is opt-in
+    get_text_splits_from_document(document, text_splitter_with_metadata)
+    assert len(node_utils._text_splits_cache) == 0
+
+    text_splits = get_text_splits_from_document(
+        document, text_splitter_with_metadata, use_cache=True
+    )
+    assert len(node_utils._text_splits_cache) == 1
+
+    # mutating the returned splits does not affect the cache
+    text_splits[0].metadata["new_key"] = "new_val"
+    cached_text_splits = get_text_splits_from_document(
+        document, text_splitter_with_metadata, use_cache=True
+    )
+    assert len(node_utils._text_splits_cache) == 1
+    assert [split.text_chunk for split in cached_text_splits] == [
+        split.text_chunk for split in text_splits
+    ]
+    assert "new_key" not in cached_text_splits[0].metadata
+
+    # cache hits emit the same chunking events as the splitter
+    event_pairs = llama_debug.get_event_pairs(CBEventType.CHUNKING)
+    assert len(event_pairs) == 3
+    assert (
+        event_pairs[2][1].payload[EventPayload.CHUNKS]
+        == event_pairs[1][1].payload[EventPayload.CHUNKS]
+    )
+
+    # a different splitter configuration is a cache miss
+    get_text_splits_from_document(
+        document,
+        TokenTextSplitterWithMetadata(chunk_size=30, chunk_overlap=0),
+        use_cache=True,
+    )
+    assert len(node_utils._text_splits_cache) == 2
+    node_utils.clear_text_splits_cache()
+
+
+def test_get_nodes_from_document_other_splitter(
+    documents: List[Document],
+) -> None:
+    """Test document metadata is only merged into nodes for other splitters."""
+    text_splitter = NewlineTextSplitter()
+    text_splits = get_text_splits_from_document(documents[0], text_splitter)
+    assert len(text_splits) == 4
+    assert all(split.metadata is None for split in text_splits)
+
+    nodes = get_nodes_from_document(documents[0], text_splitter)
+    assert [n.get_content() for n in nodes] == [
+        split.text_chunk for split in text_splits
+    ]
+    assert all(n.metadata == {"test_key": "test_val"} for n in nodes)
@@ -1,8 +1,13 @@
 """Test text splitter."""
+from typing import List
+
+from pytest import MonkeyPatch
+
 from llama_index.langchain_helpers.text_splitter import (
     SentenceSplitter,
     TokenTextSplitter,
 )
+from llama_index.utils import globals_helper
 
 
 def test_split_token() -> None:
@@ -44,6 +49,47 @@ def test_split_long_token() -> None:
     assert len(chunks[1]) == 50
 
 
+def test_split_short_text(monkeypatch: MonkeyPatch) -> None:
+    """Test text shorter than the chunk size is not tokenized."""
+    tokenized_texts = []
+    default_tokenizer = globals_helper.tokenizer
+
+    def _tokenizer(text: str) -> List[int]:
+        tokenized_texts.append(text)
+        return default_tokenizer(text)
+
+    # only the default tokenizer skips tokenizing short texts
+    monkeypatch.setattr(globals_helper, "_tokenizer", _tokenizer)
+    text = "foo bar  hello world"
+    text_splitter = TokenTextSplitter(chunk_size=50, chunk_overlap=0)
+    text_splits = text_splitter.split_text_with_overlaps(text)
+    assert [(split.text_chunk, split.num_char_overlap) for split in text_splits] == [
+        (text, 0)
+    ]
+    assert tokenized_texts == []
+
+    # same chunks as when the text is tokenized
+    text_splitter = TokenTextSplitter(
+        chunk_size=len(text), chunk_overlap=0, tokenizer=_tokenizer
+    )
+    assert text_splitter.split_text_with_overlaps(text) == text_splits
+    assert tokenized_texts != []
+    assert text_splitter.split_text(" ") == []
+
+
+def test_split_short_text_special_tokens() -> None:
+    """Test short texts are tokenized by tokenizers adding special tokens."""
+
+    def _tokenizer(text: str) -> List[int]:
+        return [0] + list(text.encode()) + [1]
+
+    text_splitter = TokenTextSplitter(
+        chunk_size=11, chunk_overlap=0, tokenizer=_tokenizer
+    )
+    text_splits = text_splitter.split_text_with_overlaps("ab cd ef")
+    assert [split.text_chunk for split in text_splits] == ["ab cd", "ef"]
+
+
 def test_split_with_metadata_str() -> None:
     """Test split while taking into account chunk size used by metadata str."""
     text = " ".join(["foo"] * 20)
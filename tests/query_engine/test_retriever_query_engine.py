@@ -1,3 +1,6 @@
+import asyncio
+from typing import List
+
 import pytest
 from llama_index import (
     ServiceContext,
@@ -5,10 +8,19 @@ from llama_index import (
     TreeIndex,
     Document,
 )
+from llama_index.indices.base_retriever import BaseRetriever
+from llama_index.indices.postprocessor import (
+    KeywordNodePostprocessor,
+    SimilarityPostprocessor,
+)
+from llama_index.indices.postprocessor.types import BaseNodePostprocessor
+from llama_index.indices.query.schema import QueryBundle
 from llama_index.llms import Anthropic
 from langchain.chat_models import ChatOpenAI
 from llama_index.indices.tree.select_leaf_retriever import TreeSelectLeafRetriever
 from llama_index.query_engine.retriever_query_engine import RetrieverQueryEngine
+from llama_index.response_synthesizers import get_response_synthesizer
+from llama_index.schema import NodeWithScore, TextNode
 
 try:
     import anthropic
@@ -70,3 +82,67 @@ def test_query_engine_falls_back_to_inheriting_retrievers_service_context() -> N
     assert (
         query_engine._response_synthesizer.service_context == retriever._service_context
     )
+
+
+class MockRetriever(BaseRetriever):
+    """Retriever returning fixed nodes."""
+
+    def __init__(self, nodes: List[NodeWithScore]) -> None:
+        self._nodes = nodes
+
+    def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        return self._nodes
+
+    async def _aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        return self._nodes
+
+
+def test_query_engine_aretrieve_postprocessors(
+    mock_service_context: ServiceContext,
+) -> None:
+    """Test async retrieval applies postprocessors like retrieval."""
+    node = TextNode(text="hello world", id_="1")
+    nodes = [
+        NodeWithScore(node=node, score=0.9),
+        NodeWithScore(node=TextNode(text="goodbye world", id_="2"), score=0.8),
+        NodeWithScore(node=node, score=0.1),
+    ]
+    query_engine = RetrieverQueryEngine.from_args(
+        MockRetriever(nodes),
+        service_context=mock_service_context,
+        node_postprocessors=[
+            KeywordNodePostprocessor(required_keywords=["hello"]),
+            SimilarityPostprocessor(similarity_cutoff=0.5),
+        ],
+    )
+    query_bundle = QueryBundle("hello")
+    retrieved_nodes = query_engine.retrieve(query_bundle)
+    assert [(n.node.node_id, n.score) for n in retrieved_nodes] == [("1", 0.9)]
+    assert asyncio.run(query_engine.aretrieve(query_bundle)) == retrieved_nodes
+
+
+def test_query_engine_postprocessors_added_later(
+    mock_service_context: ServiceContext,
+) -> None:
+    """Test postprocessors added after building the engine are applied."""
+    nodes = [
+        NodeWithScore(node=TextNode(text="hello world", id_="1"), score=0.9),
+        NodeWithScore(node=TextNode(text="goodbye world", id_="2"), score=0.8),
+        NodeWithScore(node=TextNode(text="hello there", id_="3"), score=0.1),
+    ]
+    node_postprocessors: List[BaseNodePostprocessor] = [
+        SimilarityPostprocessor(similarity_cutoff=0.5)
+    ]
+    query_engine = RetrieverQueryEngine(
+        MockRetriever(nodes),
+        response_synthesizer=get_response_synthesizer(
+            service_context=mock_service_context
+        ),
+        node_postprocessors=node_postprocessors,
+    )
+    node_postprocessors.append(KeywordNodePostprocessor(required_keywords=["hello"]))
+
+    query_bundle = QueryBundle("hello")
+    assert [n.node.node_id for n in query_engine.retrieve(query_bundle)] == ["1"]
+    retrieved_nodes = asyncio.run(query_engine.aretrieve(query_bundle))
+    assert [n.node.node_id for n in retrieved_nodes] == ["1"]